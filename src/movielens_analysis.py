@@ -1,9 +1,25 @@
+from array import array
+from bisect import bisect_right
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from itertools import chain
+from operator import itemgetter, mul
+import csv
+import hashlib
+import heapq
+import html
+import json
+import os
 import re
+import sys
+import tempfile
+import time
 import pytest
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from collections import OrderedDict
 
 
@@ -12,37 +28,112 @@ class Links:
     Analyzing data from links.csv
     """
 
-    def __init__(self, filepath):
+    MAX_WORKERS = 16
+    TIMEOUT = (3.05, 10)
+    CACHE_FIELDS = ["Director", "Budget", "Cumulative Worldwide Gross", "Runtime"]
+    CACHE_EXPIRE_AFTER = 30 * 24 * 60 * 60
+    # every pattern stops at the first </li> after its anchor, so a field missing its
+    # value can never pick up the value of the next item on the page
+    FIELD_PATTERNS = {
+        "director": re.compile(
+            rb'class="ipc-metadata-list-item__label ipc-metadata-list-item__label--btn"[^>]*>Director</span>'
+            rb'(?:(?!</li>).)*?<a[^>]*>((?:(?!</a>).)*)</a>', re.S),
+        "budget": re.compile(
+            rb'data-testid="title-boxoffice-budget"(?:(?!</li>).)*?'
+            rb'<span[^>]*class="ipc-metadata-list-item__list-content-item[^"]*"[^>]*>([^<]+)<', re.S),
+        "cumulative worldwide gross": re.compile(
+            rb'data-testid="title-boxoffice-cumulativeworldwidegross"(?:(?!</li>).)*?'
+            rb'<span[^>]*class="ipc-metadata-list-item__list-content-item[^"]*"[^>]*>([^<]+)<', re.S),
+    }
+    RUNTIME_PATTERN = re.compile(
+        rb'<li[^>]*class="(?:[^"]* )?ipc-inline-list__item(?: [^"]*)?"[^>]*>([^<]+)</li>')
+    TAG_PATTERN = re.compile(rb'<[^>]*>')
+    _movies_cache = {}
+
+    def __init__(self, filepath, cache_dir="data-folder/imdb_cache"):
         self._filepath = filepath
+        self._cache_dir = cache_dir
+        self._fields_cache = {}
+        self._session = self._create_session()
         try:
-            self.data = self._load_data()
+            self._movie_ids, self._imdb_ids, self._tmdb_ids = self._load_data()
         except Exception as e:
             print(f"Error initializing Links: {e}")
-            self.data = []
+            self._movie_ids, self._imdb_ids, self._tmdb_ids = [], [], []
+        self._imdb_keys = [self._imdb_key(imdb_id) for imdb_id in self._imdb_ids]
+
+    @property
+    def data(self):
+        """
+        The rows as {"movieId", "imdbId", "tmdbId"} dictionaries, built on demand
+        from the columns.
+        """
+        return [{"movieId": movie_id, "imdbId": imdb_id, "tmdbId": tmdb_id}
+                for movie_id, imdb_id, tmdb_id
+                in zip(self._movie_ids, self._imdb_ids, self._tmdb_ids)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    @staticmethod
+    def _create_session():
+        """
+        Creates a requests.Session that keeps one keep-alive connection pool to imdb.com,
+        so every page after the first skips the TCP and TLS handshakes.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=Links.MAX_WORKERS + 4,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        session.mount("https://", adapter)
+        session.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:102.0) Gecko/20100101 Firefox/102.0"
+        })
+        return session
+
+    def close(self):
+        """
+        Closes the HTTP session and releases its pooled connections.
+        """
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
 
     def _load_data(self):
         """
-        Reads the CSV file and stores the data as a list of lists, where each inner list
-        represents a row in the CSV file. Handles escaped commas within quotes.
+        Reads the CSV file into three columns (movieIds, imdbIds, tmdbIds). The header
+        row is skipped and quoted fields are handled by the csv module.
         """
-        data = []
+        movie_ids, imdb_ids, tmdb_ids = [], [], []
         try:
-            with open(self._filepath, "r", encoding="utf-8") as file:
-                for line in file:
-                    line = line.strip()
-                    row = re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', line)
-                    row = [field.strip('"') for field in row]
-                    movie = {
-                        "movieId": row[0],
-                        "imdbId": row[1],
-                        "tmdbId": row[2],
-                    }
-                    data.append(movie)
+            with open(self._filepath, "r", encoding="utf-8", newline="") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                for row in reader:
+                    if len(row) < 3:
+                        continue
+                    movie_ids.append(row[0])
+                    imdb_ids.append(row[1])
+                    tmdb_ids.append(row[2])
         except FileNotFoundError:
             print(f"Error: File '{self._filepath}' not found.")
         except Exception as e:
             print(f"Error reading file '{self._filepath}': {e}")
-        return data
+            movie_ids, imdb_ids, tmdb_ids = [], [], []
+        return movie_ids, imdb_ids, tmdb_ids
+
+    @staticmethod
+    def _imdb_key(imdb_id):
+        """
+        The seven-digit, zero-padded form of an imdbId used in IMDb URLs and cache file
+        names, or None if the movie has no imdbId.
+        """
+        return str(imdb_id).zfill(7) if imdb_id else None
 
     def get_imdb(self, list_of_movies, list_of_fields):
         """
@@ -52,47 +143,116 @@ class Links:
         The values should be parsed from the IMDB webpages of the movies.
         Sort it by movieId descendingly.
         """
-        # запросы долго обрабатываются
-        imdb_data = []
-        for movie in list_of_movies:
-            imdb_id = movie.get("imdbId")
-            if imdb_id:
-                url = f"https://www.imdb.com/title/tt{str(imdb_id).zfill(7)}/"
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:102.0) Gecko/20100101 Firefox/102.0"
-                }
-                response = requests.get(url, headers=headers)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, "html.parser")
-                    movie_data = [movie["movieId"]]
-                    for field in list_of_fields:
-                        field_value = self._extract_field(soup, field)
-                        movie_data.append(field_value)
-                    imdb_data.append(movie_data)
+        return self._get_imdb_rows(
+            ((movie.get("movieId"), self._imdb_key(movie.get("imdbId")))
+             for movie in list_of_movies),
+            list_of_fields)
+
+    def _get_imdb_rows(self, movie_and_imdb_ids, list_of_fields):
+        """
+        get_imdb for an iterable of (movieId, padded imdbId) pairs, so callers holding
+        the columns do not have to build a dictionary per movie.
+        """
+        # запросы долго обрабатываются, поэтому страницы скачиваются параллельно
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            results = executor.map(
+                lambda ids: self._fetch_one(*ids, list_of_fields), movie_and_imdb_ids)
+            imdb_data = [movie_data for movie_data in results if movie_data]
         imdb_data.sort(key=lambda x: int(x[0]), reverse=True)
         return imdb_data
 
-    def top_directors(self, n):
+    def _fetch_one(self, movie_id, imdb_key, list_of_fields):
         """
-        The method returns a dict with top-n directors where the keys are directors and
-        the values are numbers of movies created by them. Sort it by numbers descendingly.
+        Returns [movieId, field1, field2, ...] for a single movie, or None if the movie has
+        no imdbId or its page could not be fetched.
         """
+        if not imdb_key:
+            return None
         try:
-            list_of_movies = [{"movieId": movie["movieId"],
-                               "imdbId": movie["imdbId"]} for movie in self.data]
+            fields = self._get_fields(imdb_key)
+        except requests.RequestException as e:
+            print(f"Error fetching IMDb page for tt{imdb_key}: {e}")
+            return None
+        if fields is None:
+            return None
+        return [movie_id, *(fields.get(field.lower(), "N/A") for field in list_of_fields)]
 
-            imdb_data = self.get_imdb(list_of_movies, ["Director"])
-            directors_count = {}
+    def _get_fields(self, imdb_id):
+        """
+        Returns the dict of CACHE_FIELDS for the movie, looking it up in memory first,
+        then in the disk cache, and downloading the page only if both miss. A page with
+        none of the fields (a bot check or a changed layout) is not cached, so the next
+        call downloads it again.
+        """
+        fields = self._fields_cache.get(imdb_id)
+        if fields is None:
+            fields = self._read_cache(imdb_id)
+            if fields is None:
+                fields = self._download_fields(imdb_id)
+                if fields is None:
+                    return None
+                if all(value == "N/A" for value in fields.values()):
+                    return fields
+                self._write_cache(imdb_id, fields)
+            self._fields_cache[imdb_id] = fields
+        return fields
+
+    def _download_fields(self, imdb_id):
+        url = f"https://www.imdb.com/title/tt{imdb_id}/"
+        response = self._session.get(url, timeout=self.TIMEOUT)
+        if response.status_code != 200:
+            return None
+        values = self._extract_fields(response.content, self.CACHE_FIELDS)
+        return {field.lower(): value for field, value in zip(self.CACHE_FIELDS, values)}
 
-            for data in imdb_data:
-                director = data[1]
-                if director and director != "N/A":
-                    directors_count[director] = directors_count.get(
-                        director, 0) + 1
+    def _cache_path(self, imdb_id):
+        return os.path.join(self._cache_dir, f"tt{imdb_id}.json")
 
-            sorted_directors = sorted(
-                directors_count.items(), key=lambda x: int(x[1]), reverse=True)
-            top_directors = dict(sorted_directors[:n])
+    def _read_cache(self, imdb_id):
+        """
+        Returns the cached dict of fields for the movie, or None on a miss or an expired entry.
+        """
+        if not self._cache_dir:
+            return None
+        path = self._cache_path(imdb_id)
+        try:
+            if time.time() - os.path.getmtime(path) > self.CACHE_EXPIRE_AFTER:
+                return None
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, imdb_id, fields):
+        if not self._cache_dir:
+            return
+        path = self._cache_path(imdb_id)
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # a unique temp file per write, since the fetch threads may cache the same
+            # imdbId at once when links.csv lists it twice
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with open(fd, "w", encoding="utf-8") as file:
+                    json.dump(fields, file)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Error writing cache file '{path}': {e}")
+
+    def top_directors(self, n):
+        """
+        The method returns a dict with top-n directors where the keys are directors and
+        the values are numbers of movies created by them. Sort it by numbers descendingly.
+        """
+        try:
+            imdb_data = self._get_imdb_rows(
+                zip(self._movie_ids, self._imdb_keys), ["Director"])
+            directors_count = Counter(
+                director for _, director in imdb_data if director and director != "N/A")
+            top_directors = dict(directors_count.most_common(n))
 
             return top_directors
         except Exception as e:
@@ -146,9 +306,8 @@ class Links:
         Universal method to retrieve the top-n movies based on specific fields and calculations.
         """
         try:
-            list_of_movies = [{"movieId": movie["movieId"],
-                               "imdbId": movie["imdbId"]} for movie in self.data]
-            imdb_data = self.get_imdb(list_of_movies, fields)
+            imdb_data = self._get_imdb_rows(
+                zip(self._movie_ids, self._imdb_keys), fields)
             results = {}
             list_of_movies = Links._load_movies()
             for data in imdb_data:
@@ -161,9 +320,7 @@ class Links:
                 if value is not None:
                     results[title] = value
 
-            sorted_results = sorted(
-                results.items(), key=lambda x: x[1], reverse=True)
-            return dict(sorted_results[:n])
+            return dict(heapq.nlargest(n, results.items(), key=itemgetter(1)))
         except Exception as e:
             print(f"Error in get_top_movies: {e}")
             return {}
@@ -230,25 +387,29 @@ class Links:
     @staticmethod
     def _load_movies(filepath="data-folder/movies.csv"):
         """
-        Reads the movies.csv file and stores the data as a list of dictionaries.
-        Each dictionary represents a movie with keys: 'movieId', 'title', 'genres'.
+        Reads the movies.csv file and returns a dictionary mapping movieId to title.
+        The result is cached per file and the file is reread only after it changes.
         """
         movies = {}
         try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                next(file)
-                for line in file:
-                    line = line.strip()
-                    row = re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', line)
-                    row = [field.strip('"') for field in row]
+            stat = os.stat(filepath)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            cached = Links._movies_cache.get(filepath)
+            if cached and cached[0] == stamp:
+                return cached[1]
+            with open(filepath, "r", encoding="utf-8", newline="") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                for row in reader:
                     if len(row) >= 3:
                         movies[row[0]] = row[1]
+            Links._movies_cache[filepath] = (stamp, movies)
             return movies
         except FileNotFoundError:
             print(f"Error: File '{filepath}' not found.")
         except Exception as e:
             print(f"Error reading file '{filepath}': {e}")
-        return []
+        return {}
 
     @staticmethod
     def get_movie_title(movie_id, list_of_movies):
@@ -256,58 +417,37 @@ class Links:
         The method returns the title of the movie for the given movieId from the movies.csv file.
         If the movieId is not found, it returns None.
         """
-        try:
-            ans = None
-            if movie_id in list_of_movies:
-                ans = list_of_movies[movie_id]
-            return ans
-        except Exception as e:
-            print(f"Error in get_movie_title: {e}")
-            return None
+        return list_of_movies.get(movie_id)
 
-    def _extract_field(self, soup, field_name):
+    def _extract_fields(self, content, field_names):
         """
-        Extracts a specific field (e.g., Director, Budget, etc.) from the IMDb page soup object.
+        Extracts the requested fields (e.g., Director, Budget, etc.) from the raw bytes of
+        an IMDb page with precompiled regexes, without building a DOM.
+        Returns the values in the requested order.
         """
+        field_names = [field_name.lower() for field_name in field_names]
         try:
-            field_name = field_name.lower()
-            field_value = "N/A"
-
-            def get_text_from_tag(tag):
-                return tag.text.strip() if tag else "N/A"
-
-            base_class = "ipc-metadata-list__item"
-            extra_class = " sc-1bec5ca1-2 eoigIp"
-            content_class = "ipc-metadata-list-item__list-content-item"
-
-            if field_name == "director":
-                director_tag = soup.find(
-                    "span", class_="ipc-metadata-list-item__label ipc-metadata-list-item__label--btn", string="Director"
-                )
-                if director_tag:
-                    director = director_tag.find_parent("li").find("a")
-                    field_value = get_text_from_tag(director)
-
-            elif field_name == "runtime":
-                runtime_tag = soup.find("li", class_="ipc-inline-list__item",
-                                        string=lambda text: text and "h" in text and "m" in text)
-                if runtime_tag:
-                    field_value = runtime_tag.string.strip()
-
-            elif field_name in ["cumulative worldwide gross", "budget"]:
-                field_testid = "title-boxoffice-cumulativeworldwidegross" if field_name == "cumulative worldwide gross" else "title-boxoffice-budget"
-                tag = soup.find(
-                    "li", class_=base_class + extra_class,
-                    attrs={"data-testid": field_testid}
-                )
-                if tag:
-                    field_value = get_text_from_tag(
-                        tag.find("span", class_=content_class))
-
-            return field_value
+            def get_text_from_match(match):
+                text = self.TAG_PATTERN.sub(b"", match.group(1))
+                return html.unescape(text.decode("utf-8", "replace")).strip()
+
+            found = {}
+            for field_name in set(field_names):
+                if field_name == "runtime":
+                    for match in self.RUNTIME_PATTERN.finditer(content):
+                        text = get_text_from_match(match)
+                        if "h" in text and "m" in text:
+                            found[field_name] = text
+                            break
+                elif field_name in self.FIELD_PATTERNS:
+                    match = self.FIELD_PATTERNS[field_name].search(content)
+                    if match:
+                        found[field_name] = get_text_from_match(match)
+
+            return [found.get(field_name, "N/A") for field_name in field_names]
         except Exception as e:
-            print(f"Error extracting field '{field_name}': {e}")
-            return "N/A"
+            print(f"Error extracting fields {field_names}: {e}")
+            return ["N/A"] * len(field_names)
 
 
 class Movies:
@@ -317,77 +457,262 @@ class Movies:
 
     def __init__(self, filepath):
         self.filepath = filepath
-        self.data = self.read_data()
+        self._movie_ids, self._titles, self._genres = self.read_data()
+        self._results_cache = {}
+
+    @property
+    def data(self):
+        """
+        The rows as [movieId, title, genres] lists, built on demand from the columns.
+        """
+        return [list(row) for row in zip(self._movie_ids, self._titles, self._genres)]
 
     def read_data(self):
-        data = []
+        """
+        Reads the CSV file into three columns (movieIds, titles, genres). The header row
+        is skipped and quoted titles with commas are handled by the csv module.
+        """
+        movie_ids, titles, genres = [], [], []
         try:
-            with open(self.filepath, "r") as file:
-                data = [line.strip().split(",") if ('"' not in line)
-                        else line.strip().split('"') for line in file][1:]
+            with open(self.filepath, "r", encoding="utf-8", newline="") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                for row in reader:
+                    if len(row) >= 3:
+                        movie_ids.append(row[0])
+                        titles.append(row[1])
+                        genres.append(row[-1])
         except FileNotFoundError:
             print(f"Error: File '{self.filepath}' not found.")
         except Exception as e:
             print(f"Error reading file '{self.filepath}': {e}")
-        return data
+            movie_ids, titles, genres = [], [], []
+        return movie_ids, titles, genres
 
     def dist_by_release(self):
         """
         The method returns a dict or an OrderedDict where the keys are years and the values are counts. 
         You need to extract years from the titles. Sort it by counts descendingly.
         """
-        years = Counter([line[1][-5:-1]
-                        for line in self.data if (line[1][-5:-1]).isdigit()])
-        years = sorted(years.items(), key=lambda x: (-int(x[1]), -int(x[0])))
-        release_years = OrderedDict(years)
-        return release_years
+        years = self._results_cache.get("dist_by_release")
+        if years is None:
+            years = self._results_cache["dist_by_release"] = self._count_release_years()
+        return OrderedDict(years)
+
+    def _count_release_years(self):
+        """
+        Returns the (year, count) pairs of dist_by_release as a tuple.
+        """
+        # the year can only be in the last 6 characters, so those are counted first
+        # entirely in C and only the distinct suffixes are checked for a year
+        suffixes = Counter(map(itemgetter(slice(-6, None)),
+                               map(str.rstrip, self._titles)))
+        years = Counter()
+        for suffix, count in suffixes.items():
+            year = self._release_year(suffix)
+            if year:
+                years[year] += count
+        # years are four-digit strings, so they compare like the numbers they spell
+        return tuple(sorted(years.items(), key=itemgetter(1, 0), reverse=True))
+
+    @staticmethod
+    def _release_year(title):
+        """
+        Returns the year from a title ending with "(dddd)", or None if there is none.
+        Checks the fixed-position characters directly instead of running a regex.
+        """
+        title = title.rstrip()
+        year = title[-5:-1]
+        if title[-6:-5] == "(" and title[-1:] == ")" and year.isdecimal():
+            return year
+        return None
 
     def dist_by_genres(self):
         """
         The method returns a dict where the keys are genres and the values are counts.
      Sort it by counts descendingly.
         """
-        list_of_genres = [item.title() if "," not in item else item.replace(
-            ",", "").title() for line in self.data for item in line[-1].split("|")]
-        dict_genres = Counter(list_of_genres)
-        dict_genres = sorted(dict_genres.items(), key=lambda x: -int(x[1]))
-        genres = OrderedDict(dict_genres)
-        return genres
+        genres = self._results_cache.get("dist_by_genres")
+        if genres is None:
+            genres = self._results_cache["dist_by_genres"] = self._count_genres()
+        return OrderedDict(genres)
+
+    def _count_genres(self):
+        """
+        Returns the (genre, count) pairs of dist_by_genres as a tuple.
+        """
+        raw_genres = Counter(chain.from_iterable(
+            genres.split("|") for genres in self._genres))
+        dict_genres = Counter()
+        for genre, count in raw_genres.items():
+            dict_genres[genre.title()] += count
+        return tuple(dict_genres.most_common())
 
     def most_genres(self, n):
         """
         The method returns a dict with top-n movies where the keys are movie titles and 
         the values are the number of genres of the movie. Sort it by numbers descendingly.
         """
-        temp_movies = {}
-        for line in self.data:
-            temp_movies[line[1]] = len(line[-1].split("|"))
-        temp_movies = sorted(temp_movies.items(),
-                             key=lambda x: -int(x[1]))[:n:]
-        movies = OrderedDict(temp_movies)
-        return movies
+        # the full ranking is sorted once per instance and sliced for every n; the
+        # reverse sort is stable, so ties keep the insertion order of temp_movies
+        ranking = self._results_cache.get("most_genres")
+        if ranking is None:
+            temp_movies = {title: genres.count("|") + 1
+                           for title, genres in zip(self._titles, self._genres)}
+            ranking = self._results_cache["most_genres"] = tuple(
+                sorted(temp_movies.items(), key=itemgetter(1), reverse=True))
+        return OrderedDict(ranking[:max(n, 0)])
 
 
 class Ratings:
     """
     Analyzing data from ratings.csv
     """
+    # ratings are half-star values, stored as small integers in half-star units
+    RATING_SCALE = 2
+    CACHE_VERSION = 1
 
-    def __init__(self, path_to_the_file):
+    def __init__(self, path_to_the_file, cache_dir="ratings_cache"):
         self._filepath = path_to_the_file
-        self._data = self.read_data()
+        # a relative cache_dir is taken relative to the CSV file, so the cache sits
+        # next to the data whatever the working directory is
+        self._cache_dir = cache_dir and os.path.join(
+            os.path.dirname(os.path.abspath(path_to_the_file)), cache_dir)
+        columns = self._read_cache()
+        if columns is None:
+            columns = self.read_data()
+            if columns[4]:
+                self._write_cache(columns)
+        (self._user_levels, self._user_codes,
+         self._movie_levels, self._movie_codes,
+         self._ratings, self._timestamps) = columns
 
     def read_data(self):
-        data = []
+        """
+        Reads the CSV file column by column into typed arrays, so every value is parsed
+        once at load time. userId and movieId are stored categorically: a list of the
+        distinct ids (levels, in order of first appearance) plus an array of small integer
+        codes indexing into it. Ratings are stored as one-byte integers multiplied by
+        RATING_SCALE. Returns (user_levels, user_codes, movie_levels, movie_codes,
+        ratings, timestamps).
+        """
+        user_levels, movie_levels = {}, {}
+        user_codes, movie_codes = array("I"), array("I")
+        ratings, timestamps = array("b"), array("q")
         try:
             with open(self._filepath, "r") as file:
                 file.readline()
-                data = [line.strip().split(",") for line in file]
+                for line in file:
+                    fields = line.split(",")
+                    if len(fields) != 4:
+                        continue
+                    user_id, movie_id, rating, timestamp = fields
+                    user_codes.append(user_levels.setdefault(
+                        user_id, len(user_levels)))
+                    movie_codes.append(movie_levels.setdefault(
+                        movie_id, len(movie_levels)))
+                    ratings.append(round(float(rating) * self.RATING_SCALE))
+                    timestamps.append(int(timestamp))
         except FileNotFoundError:
             print(f"Error: File '{self._filepath}' not found.")
         except Exception as e:
             print(f"Error reading file '{self._filepath}': {e}")
-        return data
+            user_levels, movie_levels = {}, {}
+            user_codes, movie_codes = array("I"), array("I")
+            ratings, timestamps = array("b"), array("q")
+        return (list(user_levels), self._compact(user_codes, len(user_levels)),
+                list(movie_levels), self._compact(movie_codes, len(movie_levels)),
+                ratings, timestamps)
+
+    def _cache_path(self):
+        # every MovieLens release names its file ratings.csv, so the name also carries a
+        # hash of the full path to keep datasets sharing a cache_dir apart
+        path_hash = hashlib.sha1(
+            os.path.abspath(self._filepath).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self._cache_dir,
+                            f"{os.path.basename(self._filepath)}.{path_hash}.columns")
+
+    def _source_stamp(self):
+        stat = os.stat(self._filepath)
+        return [os.path.abspath(self._filepath), stat.st_mtime_ns, stat.st_size]
+
+    def _read_cache(self):
+        """
+        Returns the columns of read_data from the binary cache, or None on a miss or if
+        the CSV file has changed since the cache was written. The cache is a JSON header
+        line (source file stamp, array layouts and the levels) followed by the raw bytes
+        of the arrays, which array.fromfile reads back without parsing.
+        """
+        if not self._cache_dir:
+            return None
+        try:
+            with open(self._cache_path(), "rb") as file:
+                header = json.loads(file.readline())
+                if (header["version"] != self.CACHE_VERSION
+                        or header["source"] != self._source_stamp()
+                        or header["byteorder"] != sys.byteorder):
+                    return None
+                arrays = []
+                for typecode, itemsize, length in header["arrays"]:
+                    column = array(typecode)
+                    if column.itemsize != itemsize:
+                        return None
+                    column.fromfile(file, length)
+                    arrays.append(column)
+        except (OSError, ValueError, EOFError, KeyError, TypeError):
+            return None
+        user_codes, movie_codes, ratings, timestamps = arrays
+        return (header["user_levels"], user_codes, header["movie_levels"], movie_codes,
+                ratings, timestamps)
+
+    def _write_cache(self, columns):
+        if not self._cache_dir:
+            return
+        user_levels, user_codes, movie_levels, movie_codes, ratings, timestamps = columns
+        arrays = (user_codes, movie_codes, ratings, timestamps)
+        path = self._cache_path()
+        try:
+            header = {
+                "version": self.CACHE_VERSION,
+                "source": self._source_stamp(),
+                "byteorder": sys.byteorder,
+                "arrays": [[column.typecode, column.itemsize, len(column)]
+                           for column in arrays],
+                "user_levels": user_levels,
+                "movie_levels": movie_levels,
+            }
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            try:
+                with open(fd, "wb") as file:
+                    file.write(json.dumps(header).encode("utf-8") + b"\n")
+                    for column in arrays:
+                        column.tofile(file)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Error writing cache file '{path}': {e}")
+
+    @staticmethod
+    def _compact(codes, num_of_levels):
+        """
+        Narrows an array of codes to 2 bytes per item when the number of levels allows it.
+        """
+        if num_of_levels <= 1 << 16:
+            return array("H", codes)
+        return codes
+
+    def _categories(self, index_of_id):
+        """
+        Returns (codes, levels) of the userId (0) or movieId (1) column.
+        """
+        if index_of_id == 0:                                # User ID
+            return self._user_codes, self._user_levels
+        if index_of_id == 1:
+            return self._movie_codes, self._movie_levels
+        raise AttributeError("Wrong index of column")
 
     class Movies:
         def dist_by_year(self):
@@ -395,9 +720,16 @@ class Ratings:
             The method returns a dict where the keys are years and the values are counts. 
             Sort it by years ascendingly. You need to extract years from timestamps.
             """
-            c = Counter([datetime.fromtimestamp(
-                int(i[3])).year for i in self._data])
-            ratings_by_year = dict(sorted(c.items(), key=lambda x: x[0]))
+            if not self._timestamps:
+                return {}
+            first = datetime.fromtimestamp(min(self._timestamps)).year
+            last = datetime.fromtimestamp(max(self._timestamps)).year
+            # timestamps are bucketed by the local start of each year instead of
+            # converting every one of them to a datetime
+            year_starts = [datetime(year, 1, 1).timestamp()
+                           for year in range(first + 1, last + 1)]
+            c = Counter(map(partial(bisect_right, year_starts), self._timestamps))
+            ratings_by_year = {first + i: c[i] for i in sorted(c)}
             return ratings_by_year
 
         def dist_by_rating(self):
@@ -405,8 +737,8 @@ class Ratings:
             The method returns a dict where the keys are ratings and the values are counts.
          Sort it by ratings ascendingly.
             """
-            c = Counter([float(i[2]) for i in self._data])
-            ratings_distribution = dict(sorted(c.items(), key=lambda x: x[0]))
+            c = Counter(self._ratings)
+            ratings_distribution = {code / self.RATING_SCALE: c[code] for code in sorted(c)}
             return ratings_distribution
 
         def top_by_num_of_ratings(self, n, index_of_id=1):
@@ -415,16 +747,18 @@ class Ratings:
             It is a dict where the keys are movie titles and the values are numbers.
      Sort it by numbers descendingly.
             """
+            codes, levels = self._categories(index_of_id)
+            c = Counter(codes)
             if index_of_id == 0:                            # User ID
-                c = Counter([i[0] for i in self._data])
-            elif index_of_id == 1:
-                list_of_movies = Links._load_movies()
-                c = Counter([Links.get_movie_title(i[1], list_of_movies)
-                            for i in self._data])
+                c = Counter({levels[code]: count for code, count in c.items()})
             else:
-                raise AttributeError("Wrong index of column")
-            top_movies = dict(sorted(c.most_common(
-                n), key=lambda x: x[1], reverse=True))
+                list_of_movies = Links._load_movies()
+                counts_by_title = Counter()
+                for code, count in c.items():
+                    counts_by_title[Links.get_movie_title(
+                        levels[code], list_of_movies)] += count
+                c = counts_by_title
+            top_movies = dict(c.most_common(n))
             return top_movies
 
         @staticmethod
@@ -437,9 +771,11 @@ class Ratings:
         @staticmethod
         def _median(lst):
             n = len(lst)
-            lst = sorted(lst)
             if n == 0:
                 raise ValueError("Error: List has 0 items")
+            # timsort on a list of numbers beats any selection written in pure Python,
+            # so a full sort is still the cheapest way to the middle element
+            lst = sorted(lst)
             ans = 0
             if n % 2 == 1:
                 ans = lst[n // 2]
@@ -450,19 +786,57 @@ class Ratings:
         @staticmethod
         def _variance(lst):
             average = Ratings.Movies._average(lst)
+            # each deviation is computed once and squared with d * d instead of ** 2,
+            # so the loop has no index lookups and no pow() calls
+            deviations = [x - average for x in lst]
+            return sum(map(mul, deviations, deviations)) / len(lst)
+
+        @staticmethod
+        def _variance_from_sums(lst):
+            """
+            Computes the variance from the count, the sum and the sum of squares of the
+            list, each taken in a single C-level pass. For half-star ratings both sums are
+            exact, so the final division is the only rounding step.
+            """
             n = len(lst)
-            return sum((lst[i] - average) ** 2 for i in range(n)) / n
+            if n == 0:
+                raise ValueError("Error: List has 0 items")
+            s = sum(lst)
+            s2 = sum(map(mul, lst, lst))
+            return (n * s2 - s * s) / (n * n)
 
         def create_list_of_ratings(self, index_of_id=1):
+            """
+            Returns a dict where the keys are user ids or movie titles and the values are
+            the lists of their ratings.
+            """
+            scale = self.RATING_SCALE
+            return {key: [rating / scale for rating in lst]
+                    for key, lst in self.Movies._group_ratings(self, index_of_id).items()}
+
+        def _group_ratings(self, index_of_id=1):
+            """
+            Groups the ratings by user or movie in one pass over the columns, using the
+            category codes as list indexes, and only then translates each movieId to its
+            title, so movies.csv is consulted once per movie instead of once per rating.
+            Movies sharing a title are merged into one list. The lists hold the stored
+            ratings, i.e. multiplied by RATING_SCALE.
+            """
+            codes, levels = self._categories(index_of_id)
+            groups = [[] for _ in levels]
+            for code, rating in zip(codes, self._ratings):
+                groups[code].append(rating)
+
+            if index_of_id == 0:
+                return dict(zip(levels, groups))
             d = dict()
             list_of_movies = Links._load_movies()
-            for item in self._data:
-                key = item[index_of_id]
-                if index_of_id == 1:
-                    key = Links.get_movie_title(key, list_of_movies)
-                if not key in d:
-                    d[key] = []
-                d[key].append(float(item[2]))
+            for movie_id, lst in zip(levels, groups):
+                title = Links.get_movie_title(movie_id, list_of_movies)
+                if title in d:
+                    d[title].extend(lst)
+                else:
+                    d[title] = lst
             return d
 
         def top_by_ratings(self, n, metric="average", index_of_id=1):
@@ -477,13 +851,11 @@ class Ratings:
             funcs = {"average": self.Movies._average,
                      "median": self.Movies._median}
 
-            d = self.Movies.create_list_of_ratings(self, index_of_id)
-
-            for key in d:
-                d[key] = round(funcs[metric](d[key]), 2)
-
-            top_movies = sorted(d.items(), key=lambda x: x[1], reverse=True)
-            return dict(top_movies[0:n])
+            func = funcs[metric]
+            d = self.Movies._group_ratings(self, index_of_id)
+            values = ((key, round(func(lst) / self.RATING_SCALE, 2))
+                      for key, lst in d.items())
+            return dict(heapq.nlargest(n, values, key=itemgetter(1)))
 
         def top_controversial(self, n, index_of_id=1):
             """
@@ -495,13 +867,13 @@ class Ratings:
             if n < 0:
                 n = 0
 
-            d = self.Movies.create_list_of_ratings(self, index_of_id)
-
-            for key in d:
-                d[key] = round(self.Movies._variance(d[key]), 2)
-
-            top_movies = sorted(d.items(), key=lambda x: x[1], reverse=True)
-            return dict(top_movies[0:n])
+            scale = self.RATING_SCALE * self.RATING_SCALE
+            d = self.Movies._group_ratings(self, index_of_id)
+            # the variances are streamed into the n-sized heap of nlargest, so they are
+            # never all held at once
+            variances = ((key, round(self.Movies._variance_from_sums(lst) / scale, 2))
+                         for key, lst in d.items())
+            return dict(heapq.nlargest(n, variances, key=itemgetter(1)))
 
     class Users:
         def top_by_num_of_ratings(self, n):
@@ -527,21 +899,21 @@ class Tags:
         except Exception as e:
             print(f"Error initializing Tags: {e}")
             self.data = []
-            self.tags = []
+            self.tags = frozenset()
+        self._tags_lower = [(tag, tag.lower()) for tag in self.tags]
 
     def _load_data(self):
         """
         Reads the CSV file and stores the data as a list of lists, where each inner list
-        represents a row in the CSV file. Handles escaped commas within quotes.
+        represents a row in the CSV file. The header row is skipped and quoted fields
+        are handled by the csv module.
         """
         data = []
         try:
-            with open(self._filepath, "r", encoding="utf-8") as file:
-                for line in file:
-                    line = line.strip()
-                    row = re.split(r',(?=(?:[^"]*"[^"]*")*[^"]*$)', line)
-                    row = [field.strip('"') for field in row]
-                    data.append(row)
+            with open(self._filepath, "r", encoding="utf-8", newline="") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                data = list(reader)
         except FileNotFoundError:
             print(f"Error: File '{self._filepath}' not found.")
         except Exception as e:
@@ -553,11 +925,10 @@ class Tags:
         Extracts unique tags from the loaded data.
         """
         try:
-            tags = [row[2].strip() for row in self.data if len(row) > 2]
-            return list(set(tags))
+            return frozenset(row[2].strip() for row in self.data if len(row) > 2)
         except Exception as e:
             print(f"Error extracting tags: {e}")
-            return []
+            return frozenset()
 
     def most_words(self, n):
         """
@@ -567,9 +938,7 @@ class Tags:
         """
         try:
             word_counts = {tag: len(tag.split()) for tag in self.tags}
-            sorted_tags = sorted(word_counts.items(),
-                                 key=lambda x: x[1], reverse=True)
-            return dict(sorted_tags[:n])
+            return dict(heapq.nlargest(n, word_counts.items(), key=itemgetter(1)))
         except Exception as e:
             print(f"Error in most_words: {e}")
             return {}
@@ -580,8 +949,7 @@ class Tags:
         sorted by length in descending order. Duplicates are removed.
         """
         try:
-            sorted_tags = sorted(self.tags, key=len, reverse=True)
-            return sorted_tags[:n]
+            return heapq.nlargest(n, self.tags, key=len)
         except Exception as e:
             print(f"Error in longest: {e}")
             return []
@@ -606,19 +974,11 @@ class Tags:
         the values are the number of occurrences of each tag. Results are sorted by frequency in descending order.
         """
         try:
-            tag_counts = {}
-            tag_original = {}
-
-            for row in self.data:
-                if len(row) > 2:
-                    tag = row[2].strip()
-                    tag_lower = tag.lower()
-
-                    tag_counts[tag_lower] = tag_counts.get(tag_lower, 0) + 1
-                    tag_original[tag_lower] = tag
-            sorted_tags = sorted(tag_counts.items(),
-                                 key=lambda x: x[1], reverse=True)
-            return {tag_original[tag_lower]: count for tag_lower, count in sorted_tags[:n]}
+            tags = [row[2].strip() for row in self.data if len(row) > 2]
+            tags_lower = [tag.lower() for tag in tags]
+            tag_counts = Counter(tags_lower)
+            tag_original = dict(zip(tags_lower, tags))
+            return {tag_original[tag_lower]: count for tag_lower, count in tag_counts.most_common(n)}
         except Exception as e:
             print(f"Error in most_popular: {e}")
             return {}
@@ -629,8 +989,9 @@ class Tags:
         Duplicates are removed, and the result is sorted alphabetically.
         """
         try:
+            word = word.lower()
             filtered_tags = [
-                tag for tag in self.tags if word.lower() in tag.lower()]
+                tag for tag, tag_lower in self._tags_lower if word in tag_lower]
             return sorted(filtered_tags)
         except Exception as e:
             print(f"Error in tags_with: {e}")
@@ -644,7 +1005,7 @@ class Tests:
     # ---------------------------------------
 
     @pytest.fixture
-    def sample_tags(self):
+    def sample_tags(self, tmp_path):
         sample_data = """userId,movieId,tag,timestamp
 2,60756,funny,1445714994
 2,60756,Highly quotable,1445714996
@@ -653,10 +1014,9 @@ class Tests:
 2,89774,MMA,1445715200
 2,89774,Tom Hardy,1445715205
 2,106782,drugs,1445715054"""
-        filepath = "sample_tags.csv"
-        with open(filepath, "w", encoding="utf-8") as file:
-            file.write(sample_data)
-        return Tags(filepath)
+        filepath = tmp_path / "sample_tags.csv"
+        filepath.write_text(sample_data, encoding="utf-8")
+        return Tags(str(filepath))
 
     def test_most_words(self, sample_tags):
         result = sample_tags.most_words(3)
@@ -711,36 +1071,36 @@ class Tests:
     # Tests for Ratings class
     # ---------------------------------------
 
+    @pytest.fixture(scope="session")
+    def ratings(self):
+        return Ratings("data-folder/ratings.csv")
+
     @staticmethod
-    def test_RatingsMovies_dist_by_year():
-        r = Ratings("data-folder/ratings.csv")
-        d = Ratings.Movies.dist_by_year(r)
+    def test_RatingsMovies_dist_by_year(ratings):
+        d = Ratings.Movies.dist_by_year(ratings)
         assert type(d) == type(dict())
         keys = tuple(d.keys())
         assert all(keys[i - 1] <= keys[i] for i in range(1, len(keys)))
 
     @staticmethod
-    def test_RatingsMovies_dist_by_rating():
-        r = Ratings("data-folder/ratings.csv")
-        d = Ratings.Movies.dist_by_year(r)
+    def test_RatingsMovies_dist_by_rating(ratings):
+        d = Ratings.Movies.dist_by_year(ratings)
         assert type(d) == type(dict())
         keys = tuple(d.keys())
         assert all(keys[i - 1] <= keys[i] for i in range(1, len(keys)))
 
     @staticmethod
-    def test_RatingsMovies_top_by_num_of_ratings():
-        r = Ratings("data-folder/ratings.csv")
-        d = Ratings.Movies.top_by_num_of_ratings(r, 10)
+    def test_RatingsMovies_top_by_num_of_ratings(ratings):
+        d = Ratings.Movies.top_by_num_of_ratings(ratings, 10)
         assert type(d) == type(dict())
         values = tuple(d.values())
         assert all(values[i - 1] >= values[i] for i in range(1, len(values)))
 
     @staticmethod
-    def test_RatingsMovies_top_by_ratings():
-        r = Ratings("data-folder/ratings.csv")
+    def test_RatingsMovies_top_by_ratings(ratings):
         num_of_top = 1000
-        d1 = Ratings.Movies.top_by_ratings(r, num_of_top, metric="median")
-        d2 = Ratings.Movies.top_by_ratings(r, num_of_top)
+        d1 = Ratings.Movies.top_by_ratings(ratings, num_of_top, metric="median")
+        d2 = Ratings.Movies.top_by_ratings(ratings, num_of_top)
         assert type(d1) == type(dict())
         assert type(d2) == type(dict())
         values = tuple(d1.values())
@@ -750,10 +1110,9 @@ class Tests:
         assert len(d1) == len(d2) == num_of_top or num_of_top > len(d1)
 
     @staticmethod
-    def test_RatingsMovies_top_controversial():
-        r = Ratings("data-folder/ratings.csv")
+    def test_RatingsMovies_top_controversial(ratings):
         num_of_top = 100
-        d = Ratings.Movies.top_controversial(r, num_of_top)
+        d = Ratings.Movies.top_controversial(ratings, num_of_top)
         assert type(d) == type(dict())
         values = tuple(d.values())
         assert all(values[i - 1] >= values[i] for i in range(1, len(values)))
@@ -791,19 +1150,71 @@ class Tests:
         assert func_ans == ans
 
     @staticmethod
-    def test_RatingsUsers_top_by_num_of_ratings():
-        r = Ratings("data-folder/ratings.csv")
-        d = Ratings.Users.top_by_num_of_ratings(r, 10)
+    def test_Ratings_cache(tmp_path):
+        filepath = tmp_path / "ratings.csv"
+        filepath.write_text("userId,movieId,rating,timestamp\n1,1,4.0,964982703\n"
+                            "2,1,3.5,964981247\n")
+        cache_dir = tmp_path / "cache"
+        parsed = Ratings(str(filepath), cache_dir=str(cache_dir))
+        cached = Ratings(str(filepath), cache_dir=str(cache_dir))
+        assert cached._read_cache() is not None
+        assert cached._user_levels == parsed._user_levels == ["1", "2"]
+        assert cached._movie_codes == parsed._movie_codes
+        assert cached._ratings == parsed._ratings
+        assert cached._timestamps == parsed._timestamps
+        filepath.write_text("userId,movieId,rating,timestamp\n1,1,4.0,964982703\n")
+        assert list(Ratings(str(filepath), cache_dir=str(cache_dir))._ratings) == [8]
+
+    @staticmethod
+    def test_Ratings_skips_short_rows(tmp_path):
+        filepath = tmp_path / "ratings.csv"
+        filepath.write_text("userId,movieId,rating,timestamp\n1,1,4.0,964982703\n"
+                            "2,1\n2,1,3.5,964981247\n\n")
+        ratings = Ratings(str(filepath), cache_dir=None)
+        assert ratings._user_levels == ["1", "2"]
+        assert list(ratings._ratings) == [8, 7]
+
+    @staticmethod
+    def test_Ratings_cache_per_dataset(tmp_path):
+        cache_dir = tmp_path / "cache"
+        for name, rating in (("a", "4.0"), ("b", "3.5")):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "ratings.csv").write_text(
+                f"userId,movieId,rating,timestamp\n1,1,{rating},964982703\n")
+            Ratings(str(tmp_path / name / "ratings.csv"), cache_dir=str(cache_dir))
+        first = Ratings(str(tmp_path / "a" / "ratings.csv"), cache_dir=str(cache_dir))
+        assert first._read_cache() is not None
+        assert len(os.listdir(cache_dir)) == 2
+        default = Ratings(str(tmp_path / "a" / "ratings.csv"))
+        assert default._cache_dir == str(tmp_path / "a" / "ratings_cache")
+        assert os.path.isdir(default._cache_dir)
+
+    @staticmethod
+    def test_RatingsMovies_create_list_of_ratings(tmp_path):
+        filepath = tmp_path / "ratings.csv"
+        filepath.write_text("userId,movieId,rating,timestamp\n1,1,4.0,964982703\n"
+                            "1,2,3.5,964981247\n")
+        ratings = Ratings(str(filepath), cache_dir=None)
+        assert Ratings.Movies.create_list_of_ratings(ratings, 0) == {"1": [4.0, 3.5]}
+
+    @staticmethod
+    def test_RatingsMovies_variance_from_sums():
+        lst = [0.5, 1.0, 5.0, 2.5, 4.5, 2.0]
+        func_ans = Ratings.Movies._variance_from_sums(lst)
+        assert func_ans == pytest.approx(Ratings.Movies._variance(lst))
+
+    @staticmethod
+    def test_RatingsUsers_top_by_num_of_ratings(ratings):
+        d = Ratings.Users.top_by_num_of_ratings(ratings, 10)
         assert type(d) == type(dict())
         values = tuple(d.values())
         assert all(values[i - 1] >= values[i] for i in range(1, len(values)))
 
     @staticmethod
-    def test_RatingsUsers_top_by_ratings():
-        r = Ratings("data-folder/ratings.csv")
+    def test_RatingsUsers_top_by_ratings(ratings):
         num_of_top = 1000
-        d1 = Ratings.Users.top_by_ratings(r, num_of_top, metric="median")
-        d2 = Ratings.Users.top_by_ratings(r, num_of_top)
+        d1 = Ratings.Users.top_by_ratings(ratings, num_of_top, metric="median")
+        d2 = Ratings.Users.top_by_ratings(ratings, num_of_top)
         assert type(d1) == type(dict())
         assert type(d2) == type(dict())
         values = tuple(d1.values())
@@ -813,10 +1224,9 @@ class Tests:
         assert len(d1) == len(d2) == num_of_top or num_of_top > len(d1)
 
     @staticmethod
-    def test_RatingsUsers_top_controversial():
-        r = Ratings("data-folder/ratings.csv")
+    def test_RatingsUsers_top_controversial(ratings):
         num_of_top = 100
-        d = Ratings.Users.top_controversial(r, num_of_top)
+        d = Ratings.Users.top_controversial(ratings, num_of_top)
         assert type(d) == type(dict())
         values = tuple(d.values())
         assert all(values[i - 1] >= values[i] for i in range(1, len(values)))
@@ -826,10 +1236,13 @@ class Tests:
     # Tests for Movies class
     # ---------------------------------------
 
+    @pytest.fixture(scope="session")
+    def movies(self):
+        return Movies("data-folder/movies.csv")
+
     @staticmethod
-    def test_Movies_dist_by_release():
-        years = Movies("data-folder/movies.csv")
-        result = years.dist_by_release()
+    def test_Movies_dist_by_release(movies):
+        result = movies.dist_by_release()
         keys = tuple(result.keys())
         values = tuple(result.values())
         assert isinstance(result, dict)
@@ -838,9 +1251,25 @@ class Tests:
         assert all(values[i - 1] >= values[i] for i in range(1, len(values)))
 
     @staticmethod
-    def test_Movies_dist_by_genres():
-        genres = Movies("data-folder/movies.csv")
-        result = genres.dist_by_genres()
+    def test_Movies_data(tmp_path):
+        filepath = tmp_path / "movies.csv"
+        filepath.write_text(
+            'movieId,title,genres\n1,"American President, The (1995)",Comedy|Drama|Romance\n')
+        movies = Movies(str(filepath))
+        assert movies.data == [
+            ["1", "American President, The (1995)", "Comedy|Drama|Romance"]]
+        assert movies.dist_by_release() == {"1995": 1}
+
+    @staticmethod
+    def test_Movies_release_year():
+        assert Movies._release_year("Toy Story (1995)") == "1995"
+        assert Movies._release_year("American President, The (1995) ") == "1995"
+        assert Movies._release_year("Babylon 5") is None
+        assert Movies._release_year("Cosmos (1980–1981)") is None
+
+    @staticmethod
+    def test_Movies_dist_by_genres(movies):
+        result = movies.dist_by_genres()
         assert isinstance(result, dict)
         keys = tuple(result.keys())
         values = tuple(result.values())
@@ -850,9 +1279,16 @@ class Tests:
         assert all(values[i - 1] >= values[i] for i in range(1, len(values)))
 
     @staticmethod
-    def test_Movies_most_genres():
-        m_genres = Movies("data-folder/movies.csv")
-        result = m_genres.most_genres(10)
+    def test_Movies_results_cached(movies):
+        result = movies.dist_by_genres()
+        result.clear()
+        assert movies.dist_by_genres()
+        assert movies.dist_by_genres() is not movies.dist_by_genres()
+        assert list(movies.most_genres(10))[:3] == list(movies.most_genres(3))
+
+    @staticmethod
+    def test_Movies_most_genres(movies):
+        result = movies.most_genres(10)
         assert isinstance(result, dict)
         keys = tuple(result.keys())
         values = tuple(result.values())
@@ -866,16 +1302,130 @@ class Tests:
     # Tests for Links class
     # ---------------------------------------
 
-    @pytest.fixture
-    def sample_links(self):
+    @pytest.fixture(scope="session")
+    def sample_links(self, tmp_path_factory):
         sample_data = """movieId,imdbId,tmdbId
 1,0114709,862
 2,0113497,8844
 3,0113228,15602"""
-        filepath = "sample_links.csv"
-        with open(filepath, "w", encoding="utf-8") as file:
-            file.write(sample_data)
-        return Links(filepath)
+        filepath = tmp_path_factory.mktemp("links") / "sample_links.csv"
+        filepath.write_text(sample_data, encoding="utf-8")
+        with Links(str(filepath)) as links:
+            yield links
+
+    @staticmethod
+    def test_load_movies_cached(tmp_path):
+        filepath = tmp_path / "movies.csv"
+        filepath.write_text('movieId,title,genres\n1,"Toy Story, The (1995)",Animation\n')
+        movies = Links._load_movies(str(filepath))
+        assert movies == {"1": "Toy Story, The (1995)"}
+        assert Links._load_movies(str(filepath)) is movies
+        mtime_ns = filepath.stat().st_mtime_ns
+        filepath.write_text('movieId,title,genres\n1,"Toy Story (1995)",Animation\n')
+        os.utime(filepath, ns=(mtime_ns, mtime_ns))
+        assert Links._load_movies(str(filepath)) == {"1": "Toy Story (1995)"}
+
+    @staticmethod
+    def test_links_session(sample_links: Links):
+        session = sample_links._session
+        assert "Mozilla" in session.headers["User-Agent"]
+        assert session.get_adapter("https://www.imdb.com").max_retries.total == 3
+        # a separate instance, since leaving the with-block closes the shared session
+        own_links = Links(sample_links._filepath)
+        with own_links as links:
+            assert links is own_links
+
+    @staticmethod
+    def test_links_imdb_keys(sample_links: Links):
+        assert sample_links._imdb_keys == ["0114709", "0113497", "0113228"]
+        assert Links._imdb_key("114709") == "0114709"
+        assert Links._imdb_key("") is None
+
+    @staticmethod
+    def test_extract_fields(sample_links: Links):
+        content = (
+            b'<li class="ipc-inline-list__item">PG</li><li class="ipc-inline-list__item">1h 21m</li>'
+            b'<li><span class="ipc-metadata-list-item__label ipc-metadata-list-item__label--btn" '
+            b'aria-label="See full cast and crew">Director</span><div><ul><li>'
+            b'<a class="ipc-metadata-list-item__list-content-item" href="/name/nm1/">Conan O&#x27;Brien</a>'
+            b'</li></ul></div></li>'
+            b'<li data-testid="title-boxoffice-budget"><span class="ipc-metadata-list-item__label">Budget</span>'
+            b'<span class="ipc-metadata-list-item__list-content-item">$30,000,000 (estimated)</span></li>'
+        )
+        ans = sample_links._extract_fields(
+            content, ["Budget", "Director", "Runtime", "Cumulative Worldwide Gross"])
+        assert ans == ["$30,000,000 (estimated)", "Conan O'Brien", "1h 21m", "N/A"]
+
+    @staticmethod
+    def test_extract_fields_missing_values(sample_links: Links):
+        content = (
+            b'<li><span class="ipc-metadata-list-item__label ipc-metadata-list-item__label--btn" '
+            b'aria-label="See full cast and crew">Director</span><div><ul></ul></div></li>'
+            b'<li><span class="ipc-metadata-list-item__label ipc-metadata-list-item__label--btn" '
+            b'aria-label="See full cast and crew">Writer</span><div><ul><li>'
+            b'<a class="ipc-metadata-list-item__list-content-item" href="/name/nm2/">Joss Whedon</a>'
+            b'</li></ul></div></li>'
+            b'<li data-testid="title-boxoffice-budget"><span class="ipc-metadata-list-item__label">Budget</span>'
+            b'</li><li data-testid="title-boxoffice-cumulativeworldwidegross">'
+            b'<span class="ipc-metadata-list-item__label">Gross worldwide</span>'
+            b'<span class="ipc-metadata-list-item__list-content-item">$394,436,586</span></li>'
+        )
+        ans = sample_links._extract_fields(
+            content, ["Director", "Budget", "Cumulative Worldwide Gross"])
+        assert ans == ["N/A", "N/A", "$394,436,586"]
+
+    @staticmethod
+    def test_extract_fields_nested_director(sample_links: Links):
+        content = (
+            b'<li><span class="ipc-metadata-list-item__label ipc-metadata-list-item__label--btn" '
+            b'aria-label="See full cast and crew">Director</span><div><ul><li>'
+            b'<a class="ipc-metadata-list-item__list-content-item" href="/name/nm1/">'
+            b'<span>John Lasseter</span></a></li></ul></div></li>'
+            b'<li><a href="/name/nm2/">Joss Whedon</a></li>'
+        )
+        assert sample_links._extract_fields(content, ["Director"]) == ["John Lasseter"]
+
+    @staticmethod
+    def test_get_imdb_from_cache(sample_links: Links, tmp_path):
+        links = Links(sample_links._filepath, cache_dir=str(tmp_path))
+        cached = {"director": "John Lasseter", "runtime": "1h 21m"}
+        (tmp_path / "tt0114709.json").write_text(json.dumps(cached))
+        ans = links.get_imdb([{"movieId": "1", "imdbId": "0114709"}],
+                             ["Director", "Runtime", "Budget"])
+        assert ans == [["1", "John Lasseter", "1h 21m", "N/A"]]
+
+    @staticmethod
+    def test_get_imdb_does_not_cache_empty_page(sample_links: Links, tmp_path, monkeypatch):
+        links = Links(sample_links._filepath, cache_dir=str(tmp_path))
+        monkeypatch.setattr(links._session, "get", lambda *args, **kwargs: type(
+            "Response", (), {"status_code": 200, "content": b"<html>Robot check</html>"}))
+        ans = links.get_imdb([{"movieId": "1", "imdbId": "0114709"}], ["Director"])
+        assert ans == [["1", "N/A"]]
+        assert links._fields_cache == {}
+        assert os.listdir(tmp_path) == []
+
+    @staticmethod
+    def test_get_imdb_skips_failed_page(sample_links: Links, tmp_path, monkeypatch):
+        links = Links(sample_links._filepath, cache_dir=str(tmp_path))
+        links._fields_cache["0114709"] = {"director": "John Lasseter"}
+
+        def fail(*args, **kwargs):
+            raise requests.ConnectionError("connection refused")
+
+        monkeypatch.setattr(links._session, "get", fail)
+        ans = links.get_imdb([{"movieId": "1", "imdbId": "0114709"},
+                              {"movieId": "2", "imdbId": "0113497"}], ["Director"])
+        assert ans == [["1", "John Lasseter"]]
+
+    @staticmethod
+    def test_get_imdb_from_memory(sample_links: Links, tmp_path):
+        links = Links(sample_links._filepath, cache_dir=str(tmp_path))
+        cache_file = tmp_path / "tt0114709.json"
+        cache_file.write_text(json.dumps({"director": "John Lasseter"}))
+        movies = [{"movieId": "1", "imdbId": "0114709"}]
+        first = links.get_imdb(movies, ["Director"])
+        cache_file.unlink()
+        assert links.get_imdb(movies, ["Director"]) == first == [["1", "John Lasseter"]]
 
     @staticmethod
     def test_get_imdb(sample_links: Links):